@@ -26,6 +26,9 @@ BufferFDKAACEncoder::BufferFDKAACEncoder(
       2 *
       info.frameLength;  // 2 = (bits_per_sample) / 8 where bits_per_sample = 16
   m_aac_buffer = new std::uint8_t[Constants::FDK_AAC_ENCODE_BUFFER_SIZE];
+
+  // 1 フレーム分を確保しておき, addSample() で再確保が起きないようにする
+  m_pcm_buffer.reserve(m_max_sample_size);
 }
 
 BufferFDKAACEncoder::~BufferFDKAACEncoder() {
@@ -35,6 +35,9 @@ BufferOpusEncoder::BufferOpusEncoder(std::queue<hisui::Frame>* t_buffer,
   }
 
   spdlog::debug("BufferOpusEncoder: skip={}", m_skip);
+
+  // 1 フレーム分 (2 チャンネル) を確保しておき, addSample() で再確保が起きないようにする
+  m_pcm_buffer.reserve(hisui::Constants::OPUS_ENCODE_FRAME_SIZE * 2);
 }
 
 BufferOpusEncoder::~BufferOpusEncoder() {
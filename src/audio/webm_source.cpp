@@ -5,7 +5,6 @@
 #include <spdlog/spdlog.h>
 
 #include <cstddef>
-#include <iterator>
 
 #include "audio/decoder.hpp"
 #include "audio/opus_decoder.hpp"
@@ -33,9 +32,11 @@ WebMSource::WebMSource(const std::string& t_file_path) {
 
   switch (m_webm->getCodec()) {
     case hisui::webm::input::AudioCodec::Opus:
-      m_channels = m_webm->getChannels(),
       m_sampling_rate = static_cast<std::uint64_t>(m_webm->getSamplingRate());
-      m_decoder = new OpusDecoder(m_channels);
+      // モノラルでも libopus にステレオへ変換させて, getSample() でチャンネル数による分岐をしない
+      // 1, 2 以外のチャンネル数はこれまで通り OpusDecoder のコンストラクタでエラーにする
+      m_decoder = new OpusDecoder(
+          m_webm->getChannels() == 1 ? 2 : m_webm->getChannels());
       if (hisui::report::Reporter::hasInstance()) {
         hisui::report::Reporter::getInstance().registerAudioDecoder(
             m_webm->getFilePath(), {.codec = "opus",
@@ -75,22 +76,15 @@ std::pair<std::int16_t, std::int16_t> WebMSource::getSample(
     return {0, 0};
   }
 
-  if (std::empty(m_data)) {
+  if (m_data_position >= m_data_size) {
     // データが空だったら次のフレームを読んで, その後の m_decoder と m_current_position の値に応じた処理を行なう
     readFrame();
     return getSample(position);
   }
 
-  if (m_channels == 1) {
-    const std::int16_t d = m_data.front();
-    m_data.pop();
-    return {d, d};
-  }
-
-  const std::int16_t f = m_data.front();
-  m_data.pop();
-  const std::int16_t s = m_data.front();
-  m_data.pop();
+  const std::int16_t f = m_data[m_data_position];
+  const std::int16_t s = m_data[m_data_position + 1];
+  m_data_position += 2;
   return {f, s};
 }
 
@@ -100,11 +94,10 @@ void WebMSource::readFrame() {
                          m_sampling_rate / hisui::Constants::NANO_SECOND;
     const auto decoded =
         m_decoder->decode(m_webm->getBuffer(), m_webm->getBufferSize());
-    if (decoded.second > 0) {
-      for (std::size_t i = 0; i < decoded.second; ++i) {
-        m_data.push(decoded.first[i]);
-      }
-    }
+    // デコーダのバッファは次の decode() まで有効なので, キューに積み直さずにそのまま読む
+    m_data = decoded.first;
+    m_data_size = decoded.second;
+    m_data_position = 0;
   } else {
     delete m_decoder;
     m_decoder = nullptr;
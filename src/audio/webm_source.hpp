@@ -1,7 +1,7 @@
 #pragma once
 
+#include <cstddef>
 #include <cstdint>
-#include <queue>
 #include <string>
 #include <utility>
 
@@ -26,9 +26,10 @@ class WebMSource : public Source {
  private:
   hisui::webm::input::AudioContext* m_webm = nullptr;
   hisui::audio::Decoder* m_decoder = nullptr;
-  int m_channels;
   std::uint64_t m_sampling_rate;
-  std::queue<std::int16_t> m_data;
+  const std::int16_t* m_data = nullptr;
+  std::size_t m_data_size = 0;
+  std::size_t m_data_position = 0;
   std::uint64_t m_current_position = 0;
 
   void readFrame();
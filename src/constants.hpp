@@ -22,6 +22,8 @@ class Constants {
   static const std::uint64_t OPUS_ENCODE_FRAME_SIZE = 960;
   static const std::uint64_t OPUS_DECODE_MAX_FRAME_SIZE = 5760;
   static const std::uint64_t OPUS_MAX_PACKET_SIZE = 1276;
+  static const std::uint64_t WEBM_INPUT_FILE_BUFFER_SIZE = 65536;
+  static const std::uint64_t OUTPUT_FILE_BUFFER_SIZE = 1048576;
   inline static const std::string HISUI_APPLICATION_NAME = "hisui";
 };
 
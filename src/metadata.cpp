@@ -8,7 +8,9 @@
 #include <compare>  // NOLINT
 #include <filesystem>
 #include <fstream>
+#include <ios>
 #include <iterator>
+#include <sstream>
 #include <stdexcept>
 #include <tuple>
 #include <utility>
@@ -33,11 +35,11 @@ Archive::Archive(const std::filesystem::path& t_path,
       m_start_time_offset(t_start_time_offset),
       m_stop_time_offset(t_stop_time_offset) {}
 
-std::filesystem::path Archive::getPath() const {
+const std::filesystem::path& Archive::getPath() const {
   return m_path;
 }
 
-std::string Archive::getConnectionID() const {
+const std::string& Archive::getConnectionID() const {
   return m_connection_id;
 }
 
@@ -73,21 +75,19 @@ Metadata::Metadata(const std::string& file_path, const boost::json::value& jv)
   std::filesystem::current_path(m_path.parent_path());
   std::vector<std::tuple<std::string, std::string, double, double>> archives;
 
-  auto json_archives = prepare(jv);
+  const auto& json_archives = prepare(jv);
 
   for (const auto& a : json_archives) {
-    boost::json::object o;
-    if (auto p = a.if_object()) {
-      o = *p;
-    } else {
+    const auto o = a.if_object();
+    if (o == nullptr) {
       throw std::runtime_error("a.if_object() failed");
     }
-    auto a_file_path = get_string_from_json_object(o, "file_path");
-    auto a_connection_id = get_string_from_json_object(o, "connection_id");
+    auto a_file_path = get_string_from_json_object(*o, "file_path");
+    auto a_connection_id = get_string_from_json_object(*o, "connection_id");
     double a_start_time_offset =
-        get_double_from_json_object(o, "start_time_offset");
+        get_double_from_json_object(*o, "start_time_offset");
     double a_stop_time_offset =
-        get_double_from_json_object(o, "stop_time_offset");
+        get_double_from_json_object(*o, "stop_time_offset");
     spdlog::debug("{} {} {} {}", a_file_path, a_connection_id,
                   a_start_time_offset, a_stop_time_offset);
     archives.emplace_back(a_file_path, a_connection_id, a_start_time_offset,
@@ -167,51 +167,51 @@ double Metadata::getCreatedAt() const {
   return m_created_at;
 }
 
-boost::json::array Metadata::prepare(const boost::json::value& jv) {
-  boost::json::object j;
-  if (auto p = jv.if_object()) {
-    j = *p;
-  } else {
+const boost::json::array& Metadata::prepare(const boost::json::value& jv) {
+  const auto j = jv.if_object();
+  if (j == nullptr) {
     throw std::runtime_error("jv.if_object() failed");
   }
 
-  m_recording_id = get_string_from_json_object(j, "recording_id");
-  m_created_at = get_double_from_json_object(j, "created_at");
+  m_recording_id = get_string_from_json_object(*j, "recording_id");
+  m_created_at = get_double_from_json_object(*j, "created_at");
 
-  if (j["archives"] == nullptr) {
+  const auto archives = j->if_contains("archives");
+  if (archives == nullptr || archives->is_null()) {
     throw std::invalid_argument("not metadata json file: {}");
   }
 
-  boost::json::array ja;
-  if (auto p = j["archives"].if_array()) {
-    ja = *p;
-  } else {
+  const auto ja = archives->if_array();
+  if (ja == nullptr) {
     throw std::runtime_error("if_array() failed");
   }
 
-  if (std::size(ja) == 0) {
+  if (std::size(*ja) == 0) {
     throw std::invalid_argument("metadata json file does not include archives");
   }
-  return ja;
+  return *ja;
 }
 
 boost::json::string Metadata::getRecordingID() const {
   return m_recording_id;
 }
 
-boost::json::string get_string_from_json_object(boost::json::object o,
+boost::json::string get_string_from_json_object(const boost::json::object& o,
                                                 const std::string& key) {
-  if (auto p = o[key].if_string()) {
-    return *p;
+  if (const auto v = o.if_contains(key)) {
+    if (const auto p = v->if_string()) {
+      return *p;
+    }
   }
   throw std::runtime_error(fmt::format("o[{}].if_string() failed", key));
 }
 
-double get_double_from_json_object(boost::json::object o,
+double get_double_from_json_object(const boost::json::object& o,
                                    const std::string& key) {
-  if (o[key].is_number()) {
+  const auto v = o.if_contains(key);
+  if (v != nullptr && v->is_number()) {
     boost::json::error_code ec;
-    auto value = o[key].to_number<double>(ec);
+    auto value = v->to_number<double>(ec);
     if (ec) {
       throw std::runtime_error(
           fmt::format("o[{}].to_number() failed: {}", key, ec.message()));
@@ -222,13 +222,16 @@ double get_double_from_json_object(boost::json::object o,
 }
 
 Metadata parse_metadata(const std::string& filename) {
-  std::ifstream i(filename);
+  std::ifstream i(filename, std::ios_base::binary);
   if (!i.is_open()) {
     throw std::runtime_error(
         fmt::format("failed to open metadata json file: {}", filename));
   }
-  std::string string_json((std::istreambuf_iterator<char>(i)),
-                          std::istreambuf_iterator<char>());
+  // 1 文字ずつ読むのではなく, streambuf からまとめて読む
+  // ファイルサイズには依存しないので FIFO や /dev/stdin も読める
+  std::ostringstream ss;
+  ss << i.rdbuf();
+  const std::string string_json = ss.str();
   boost::json::error_code ec;
   boost::json::value jv = boost::json::parse(string_json, ec);
   if (ec) {
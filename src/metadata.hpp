@@ -19,8 +19,8 @@ class Archive {
           const double,
           const double);
 
-  std::filesystem::path getPath() const;
-  std::string getConnectionID() const;
+  const std::filesystem::path& getPath() const;
+  const std::string& getConnectionID() const;
   double getStartTimeOffset() const;
   double getStopTimeOffset() const;
   void adjustTimeOffsets(double);
@@ -52,7 +52,7 @@ class Metadata {
   std::vector<Archive> deleteArchivesByConnectionID(const std::string&);
 
  private:
-  boost::json::array prepare(const boost::json::value& jv);
+  const boost::json::array& prepare(const boost::json::value& jv);
   void setTimeOffsets();
 
   std::filesystem::path m_path;
@@ -83,9 +83,9 @@ class MetadataSet {
   bool m_has_preferred = false;
 };
 
-boost::json::string get_string_from_json_object(boost::json::object o,
+boost::json::string get_string_from_json_object(const boost::json::object& o,
                                                 const std::string& key);
-double get_double_from_json_object(boost::json::object o,
+double get_double_from_json_object(const boost::json::object& o,
                                    const std::string& key);
 
 }  // namespace hisui
@@ -4,8 +4,11 @@
 #include <spdlog/fmt/fmt.h>
 #include <spdlog/spdlog.h>
 
+#include <chrono>
 #include <cmath>
+#include <cstddef>
 #include <cstdint>
+#include <iterator>
 #include <mutex>
 #include <utility>
 #include <vector>
@@ -17,6 +20,13 @@
 #include "constants.hpp"
 #include "frame.hpp"
 
+namespace {
+
+// m_mutex_buffer のロックをサンプルごとに取らないように, この数だけまとめて encoder に渡す
+constexpr std::size_t MIXED_SAMPLES_BATCH_SIZE = 1024;
+
+}  // namespace
+
 namespace hisui::muxer {
 
 AudioProducer::AudioProducer(const AudioProducerParameters& params)
@@ -34,6 +44,8 @@ AudioProducer::~AudioProducer() {
 void AudioProducer::produce() {
   try {
     std::vector<std::pair<std::int16_t, std::int16_t>> samples;
+    std::vector<std::pair<std::int16_t, std::int16_t>> mixed_samples;
+    mixed_samples.reserve(MIXED_SAMPLES_BATCH_SIZE);
 
     const std::uint64_t max_time = static_cast<std::uint64_t>(
         std::ceil(m_max_stop_time_offset * hisui::Constants::PCM_SAMPLE_RATE));
@@ -53,9 +65,9 @@ void AudioProducer::produce() {
           right = m_mix_sample(right, r);
         }
       }
-      {
-        std::lock_guard<std::mutex> lock(m_mutex_buffer);
-        m_encoder->addSample(left, right);
+      mixed_samples.emplace_back(left, right);
+      if (std::size(mixed_samples) >= MIXED_SAMPLES_BATCH_SIZE) {
+        addSamplesToEncoder(&mixed_samples);
       }
 
       // 毎回 setTicks & display すると顕著に遅くなる
@@ -65,11 +77,13 @@ void AudioProducer::produce() {
       }
     }
 
+    addSamplesToEncoder(&mixed_samples);
     {
       std::lock_guard<std::mutex> lock(m_mutex_buffer);
       m_encoder->flush();
       m_is_finished = true;
     }
+    m_cv_buffer.notify_one();
 
     if (m_show_progress_bar) {
       progress_bar.setTicks(max_time);
@@ -77,11 +91,32 @@ void AudioProducer::produce() {
     }
   } catch (const std::exception& e) {
     spdlog::error("AudioProducer::produce() failed: what={}", e.what());
-    m_is_finished = true;
+    {
+      std::lock_guard<std::mutex> lock(m_mutex_buffer);
+      m_is_finished = true;
+    }
+    m_cv_buffer.notify_one();
     throw;
   }
 }
 
+void AudioProducer::addSamplesToEncoder(
+    std::vector<std::pair<std::int16_t, std::int16_t>>* mixed_samples) {
+  bool is_pushed;
+  {
+    std::lock_guard<std::mutex> lock(m_mutex_buffer);
+    const auto size = std::size(m_buffer);
+    for (const auto& [left, right] : *mixed_samples) {
+      m_encoder->addSample(left, right);
+    }
+    is_pushed = std::size(m_buffer) > size;
+  }
+  mixed_samples->clear();
+  if (is_pushed) {
+    m_cv_buffer.notify_one();
+  }
+}
+
 void AudioProducer::bufferPop() {
   std::lock_guard<std::mutex> lock(m_mutex_buffer);
   m_buffer.pop();
@@ -100,4 +135,11 @@ bool AudioProducer::isFinished() {
   return m_is_finished && m_buffer.empty();
 }
 
+// バッファにフレームが積まれるか処理が終了するまで待つ
+void AudioProducer::waitForBuffer() {
+  std::unique_lock<std::mutex> lock(m_mutex_buffer);
+  m_cv_buffer.wait_for(lock, std::chrono::milliseconds(100),
+                       [this] { return m_is_finished || !m_buffer.empty(); });
+}
+
 }  // namespace hisui::muxer
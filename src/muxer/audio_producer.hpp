@@ -1,9 +1,12 @@
 #pragma once
 
+#include <condition_variable>
 #include <cstdint>
 #include <mutex>
 #include <optional>
 #include <queue>
+#include <utility>
+#include <vector>
 
 namespace hisui {
 
@@ -32,6 +35,7 @@ class AudioProducer {
   void bufferPop();
   std::optional<hisui::Frame> bufferFront();
   bool isFinished();
+  void waitForBuffer();
 
  protected:
   std::queue<hisui::Frame> m_buffer;
@@ -41,9 +45,13 @@ class AudioProducer {
   double m_max_stop_time_offset;
 
   std::mutex m_mutex_buffer;
+  std::condition_variable m_cv_buffer;
 
   bool m_show_progress_bar;
   bool m_is_finished = false;
+
+ private:
+  void addSamplesToEncoder(std::vector<std::pair<std::int16_t, std::int16_t>>*);
 };
 
 }  // namespace hisui::muxer
@@ -2,6 +2,7 @@
 
 #include <cstdint>
 #include <filesystem>
+#include <ios>
 #include <iterator>
 #include <string>
 #include <vector>
@@ -61,7 +62,11 @@ void MP4Muxer::initialize(const hisui::Config& config_orig,
     m_chunk_interval = 1000;  // 1000 ms
   }
 
-  m_ofs = std::ofstream(config.out_filename, std::ios_base::binary);
+  // 小さな書き込みが多いので, open() の前に大きめのバッファを設定しておく
+  m_ofs_buffer.resize(hisui::Constants::OUTPUT_FILE_BUFFER_SIZE);
+  m_ofs.rdbuf()->pubsetbuf(m_ofs_buffer.data(), static_cast<std::streamsize>(
+                                                    std::size(m_ofs_buffer)));
+  m_ofs.open(config.out_filename, std::ios_base::binary);
 
   if (config.out_audio_codec == config::OutAudioCodec::FDK_AAC) {
 #ifdef USE_FDK_AAC
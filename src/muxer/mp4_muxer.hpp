@@ -34,6 +34,8 @@ class MP4Muxer : public Muxer {
   ~MP4Muxer();
 
  protected:
+  // m_ofs より先に破棄されないように m_ofs の前に宣言する
+  std::vector<char> m_ofs_buffer;
   std::ofstream m_ofs;
   shiguredo::mp4::writer::Writer* m_writer;
   shiguredo::mp4::track::VideTrack* m_vide_track = nullptr;
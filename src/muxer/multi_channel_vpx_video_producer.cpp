@@ -103,6 +103,8 @@ void MultiChannelVPXVideoProducer::produce() {
 
   try {
     std::vector<const video::YUVImage*> yuvs;
+    // フレームごとに {yuvs[0]} で vector を作らないように使い回す
+    std::vector<const video::YUVImage*> preferred_yuvs(1);
     std::vector<unsigned char> raw_image;
     yuvs.resize(m_sequencer->getSize());
 
@@ -120,14 +122,12 @@ void MultiChannelVPXVideoProducer::produce() {
         raw_image.resize(m_preferred_channel_composer->getWidth() *
                              m_preferred_channel_composer->getHeight() * 3 >>
                          1);
-        m_preferred_channel_composer->compose(&raw_image, {yuvs[0]});
+        preferred_yuvs[0] = yuvs[0];
+        m_preferred_channel_composer->compose(&raw_image, preferred_yuvs);
         m_encoder->setResolutionAndBitrate(
             m_preferred_channel_composer->getWidth(),
             m_preferred_channel_composer->getHeight(), m_preferred_bit_rate);
-        {
-          std::lock_guard<std::mutex> lock(m_mutex_buffer);
-          m_encoder->outputImage(raw_image);
-        }
+        outputImageToEncoder(raw_image);
 
       } else {
         raw_image.resize(m_normal_channel_composer->getWidth() *
@@ -137,10 +137,7 @@ void MultiChannelVPXVideoProducer::produce() {
         m_encoder->setResolutionAndBitrate(
             m_normal_channel_composer->getWidth(),
             m_normal_channel_composer->getHeight(), m_normal_bit_rate);
-        {
-          std::lock_guard<std::mutex> lock(m_mutex_buffer);
-          m_encoder->outputImage(raw_image);
-        }
+        outputImageToEncoder(raw_image);
       }
       if (m_show_progress_bar) {
         progress_bar.setTicks(t);
@@ -153,6 +150,7 @@ void MultiChannelVPXVideoProducer::produce() {
       m_encoder->flush();
       m_is_finished = true;
     }
+    m_cv_buffer.notify_one();
 
     if (m_show_progress_bar) {
       progress_bar.setTicks(max_time);
@@ -160,7 +158,7 @@ void MultiChannelVPXVideoProducer::produce() {
     }
   } catch (const std::exception& e) {
     spdlog::error("VideoProducer::produce() failed: what={}", e.what());
-    m_is_finished = true;
+    finish();
     throw e;
   }
 }
@@ -3,11 +3,9 @@
 #include <cxxabi.h>
 #include <spdlog/spdlog.h>
 
-#include <chrono>
 #include <future>
 #include <optional>
 #include <system_error>
-#include <thread>
 
 #include <boost/cstdint.hpp>
 #include <boost/exception/exception.hpp>
@@ -26,15 +24,13 @@ void Muxer::mux() {
   auto audio_future =
       std::async(std::launch::async, &AudioProducer::produce, m_audio_producer);
 
-  std::this_thread::sleep_for(std::chrono::milliseconds(100));
-
   bool video_finished = false;
 
   while (!m_audio_producer->isFinished()) {
     const auto audio_front = m_audio_producer->bufferFront();
     if (!audio_front.has_value()) {
       spdlog::debug("audio queue is empty");
-      std::this_thread::sleep_for(std::chrono::milliseconds(100));
+      m_audio_producer->waitForBuffer();
       continue;
     }
     const auto audio_timestamp = audio_front.value().timestamp;
@@ -55,7 +51,7 @@ void Muxer::mux() {
     const auto video_front = m_video_producer->bufferFront();
     if (!video_front.has_value()) {
       spdlog::debug("video queue is empty (1)");
-      std::this_thread::sleep_for(std::chrono::milliseconds(1000));
+      m_video_producer->waitForBuffer();
       continue;
     }
     const auto video_timestamp =
@@ -81,7 +77,7 @@ void Muxer::mux() {
     const auto video_front = m_video_producer->bufferFront();
     if (!video_front.has_value()) {
       spdlog::debug("video queue is empty (2)");
-      std::this_thread::sleep_for(std::chrono::milliseconds(1000));
+      m_video_producer->waitForBuffer();
       continue;
     }
 
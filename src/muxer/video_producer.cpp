@@ -4,8 +4,10 @@
 #include <spdlog/fmt/fmt.h>
 #include <spdlog/spdlog.h>
 
+#include <chrono>
 #include <cmath>
 #include <cstdint>
+#include <iterator>
 #include <mutex>
 #include <optional>
 #include <vector>
@@ -65,10 +67,7 @@ void VideoProducer::produce() {
          t < max_time; t += step) {
       m_sequencer->getYUVs(&yuvs, t);
       m_composer->compose(&raw_image, yuvs);
-      {
-        std::lock_guard<std::mutex> lock(m_mutex_buffer);
-        m_encoder->outputImage(raw_image);
-      }
+      outputImageToEncoder(raw_image);
 
       if (m_show_progress_bar) {
         progress_bar.setTicks(t);
@@ -81,6 +80,7 @@ void VideoProducer::produce() {
       m_encoder->flush();
       m_is_finished = true;
     }
+    m_cv_buffer.notify_one();
 
     if (m_show_progress_bar) {
       progress_bar.setTicks(max_time);
@@ -88,11 +88,33 @@ void VideoProducer::produce() {
     }
   } catch (const std::exception& e) {
     spdlog::error("VideoProducer::produce() failed: what={}", e.what());
-    m_is_finished = true;
+    finish();
     throw;
   }
 }
 
+void VideoProducer::outputImageToEncoder(
+    const std::vector<unsigned char>& raw_image) {
+  bool is_pushed;
+  {
+    std::lock_guard<std::mutex> lock(m_mutex_buffer);
+    const auto size = std::size(m_buffer);
+    m_encoder->outputImage(raw_image);
+    is_pushed = std::size(m_buffer) > size;
+  }
+  if (is_pushed) {
+    m_cv_buffer.notify_one();
+  }
+}
+
+void VideoProducer::finish() {
+  {
+    std::lock_guard<std::mutex> lock(m_mutex_buffer);
+    m_is_finished = true;
+  }
+  m_cv_buffer.notify_one();
+}
+
 void VideoProducer::bufferPop() {
   std::lock_guard<std::mutex> lock(m_mutex_buffer);
   m_buffer.pop();
@@ -111,6 +133,13 @@ bool VideoProducer::isFinished() {
   return m_is_finished && m_buffer.empty();
 }
 
+// バッファにフレームが積まれるか処理が終了するまで待つ
+void VideoProducer::waitForBuffer() {
+  std::unique_lock<std::mutex> lock(m_mutex_buffer);
+  m_cv_buffer.wait_for(lock, std::chrono::milliseconds(100),
+                       [this] { return m_is_finished || !m_buffer.empty(); });
+}
+
 std::uint32_t VideoProducer::getWidth() const {
   return m_composer->getWidth();
 }
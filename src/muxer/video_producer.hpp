@@ -1,9 +1,11 @@
 #pragma once
 
+#include <condition_variable>
 #include <cstdint>
 #include <mutex>
 #include <optional>
 #include <queue>
+#include <vector>
 
 #include <boost/cstdint.hpp>
 #include <boost/rational.hpp>
@@ -37,6 +39,7 @@ class VideoProducer {
   void bufferPop();
   std::optional<hisui::Frame> bufferFront();
   bool isFinished();
+  void waitForBuffer();
 
   std::uint32_t getWidth() const;
   std::uint32_t getHeight() const;
@@ -54,9 +57,13 @@ class VideoProducer {
   bool m_is_finished = false;
 
   std::mutex m_mutex_buffer;
+  std::condition_variable m_cv_buffer;
 
   double m_max_stop_time_offset;
   boost::rational<std::uint64_t> m_frame_rate;
+
+  void outputImageToEncoder(const std::vector<unsigned char>&);
+  void finish();
 };
 
 }  // namespace hisui::muxer
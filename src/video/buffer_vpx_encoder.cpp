@@ -114,6 +114,7 @@ void BufferVPXEncoder::setResolutionAndBitrate(const std::uint32_t width,
   spdlog::debug("width: {}, height: {}", width, height);
   m_width = width;
   m_height = height;
+  m_bitrate = bitrate;
   m_cfg.g_w = width;
   m_cfg.g_h = height;
   m_cfg.rc_target_bitrate = bitrate;
@@ -125,6 +126,14 @@ void BufferVPXEncoder::setResolutionAndBitrate(const std::uint32_t width,
                     ::vpx_codec_err_to_string(res)));
   }
 
+  // 確保済みの領域に収まる場合は再確保せずに表示領域だけを変更する
+  if (m_width <= m_raw_vpx_image.w && m_height <= m_raw_vpx_image.h) {
+    if (::vpx_img_set_rect(&m_raw_vpx_image, 0, 0, m_width, m_height) != 0) {
+      throw std::runtime_error("vpx_img_set_rect() failed");
+    }
+    return;
+  }
+
   ::vpx_img_free(&m_raw_vpx_image);
   if (!::vpx_img_alloc(&m_raw_vpx_image, VPX_IMG_FMT_I420, m_width, m_height,
                        0)) {
@@ -42,9 +42,6 @@ GridComposer::GridComposer(const std::uint32_t t_single_width,
   m_plane_sizes[0] = m_width * m_height;
   m_plane_sizes[1] = (m_plane_sizes[0] + 3) >> 2;
   m_plane_sizes[2] = m_plane_sizes[1];
-  m_planes[0] = new unsigned char[m_plane_sizes[0]];
-  m_planes[1] = new unsigned char[m_plane_sizes[1]];
-  m_planes[2] = new unsigned char[m_plane_sizes[2]];
 
   m_single_plane_widths[0] = m_single_width;
   m_single_plane_widths[1] = (m_single_width + 1) >> 1;
@@ -57,28 +54,22 @@ GridComposer::GridComposer(const std::uint32_t t_single_width,
   m_plane_default_values[2] = 128;
 }
 
-GridComposer::~GridComposer() {
-  for (std::size_t p = 0; p < 3; ++p) {
-    delete[] m_planes[p];
-  }
-}
-
 void GridComposer::compose(std::vector<unsigned char>* composed,
                            const std::vector<const YUVImage*>& images) {
   for (std::size_t i = 0; i < m_size; ++i) {
     m_scaled_images[i] = m_scalers[i]->scale(images[i]);
   }
 
-  auto base = 0;
+  // 中間バッファを経由せずに composed へ直接書き込む
+  std::size_t base = 0;
   for (std::size_t p = 0; p < 3; ++p) {
     for (std::size_t i = 0; i < m_size; ++i) {
       m_srcs[i] = m_scaled_images[i]->yuv[p];
     }
-    merge_yuv_planes_from_top_left(m_planes[p], m_plane_sizes[p], m_column,
-                                   m_srcs, m_size, m_single_plane_widths[p],
-                                   m_single_plane_heights[p],
-                                   m_plane_default_values[p]);
-    std::copy_n(m_planes[p], m_plane_sizes[p], composed->data() + base);
+    merge_yuv_planes_from_top_left(
+        composed->data() + base, m_plane_sizes[p], m_column, m_srcs, m_size,
+        m_single_plane_widths[p], m_single_plane_heights[p],
+        m_plane_default_values[p]);
     base += m_plane_sizes[p];
   }
 }
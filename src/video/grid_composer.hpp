@@ -25,8 +25,6 @@ class GridComposer : public Composer {
                const hisui::config::VideoScaler&,
                const libyuv::FilterMode);
 
-  ~GridComposer();
-
   void compose(std::vector<unsigned char>*,
                const std::vector<const YUVImage*>&);
 
@@ -36,7 +34,6 @@ class GridComposer : public Composer {
   std::size_t m_size;
   std::size_t m_column;
   std::size_t m_row;
-  std::array<unsigned char*, 3> m_planes;
   std::array<std::size_t, 3> m_plane_sizes;
   std::array<std::uint32_t, 3> m_single_plane_widths;
   std::array<std::uint32_t, 3> m_single_plane_heights;
@@ -51,13 +51,11 @@ SequencerGetYUVsResult MultiChannelSequencer::getYUVs(
         std::begin(*p.second), std::end(*p.second),
         [timestamp](const auto& s) { return s.second.isIn(timestamp); });
     if (it != std::end(*p.second)) {
-      spdlog::debug("preferred");
       (*yuvs)[0] = it->first->getYUV(it->second.getSubstructLower(timestamp));
       return {.is_preferred_stream = true};
     }
   }
 
-  spdlog::debug("normal");
   std::size_t i = 0;
   for (const auto& p : m_sequence) {
     const auto it = std::find_if(
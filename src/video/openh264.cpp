@@ -1,8 +1,8 @@
 #include "video/openh264.hpp"
 
 #include <codec/api/svc/codec_def.h>
+#include <libyuv/planar_functions.h>
 
-#include <algorithm>
 #include <array>
 #include <cstddef>
 #include <cstdint>
@@ -27,20 +27,20 @@ void update_yuv_image_by_openh264_buffer_info(
 
   yuv_image->setWidthAndHeight(width0, height0);
 
-  for (std::size_t i = 0; i < height0; ++i) {
-    std::copy_n(buffer_info.pDst[0] + i * stride0, width0,
-                yuv_image->yuv[0] + i * width0);
-  }
+  // stride と幅が一致する場合は libyuv::CopyPlane() がまとめて 1 回でコピーする
+  libyuv::CopyPlane(buffer_info.pDst[0], static_cast<int>(stride0),
+                    yuv_image->yuv[0], static_cast<int>(width0),
+                    static_cast<int>(width0), static_cast<int>(height0));
   const auto width1 = (width0 + 1) >> 1;
   const auto height1 = (height0 + 1) >> 1;
   const std::uint32_t stride1 =
       static_cast<std::uint32_t>(buffer_info.UsrData.sSystemBuffer.iStride[1]);
-  for (std::size_t i = 0; i < height1; ++i) {
-    std::copy_n(buffer_info.pDst[1] + i * stride1, width1,
-                yuv_image->yuv[1] + i * width1);
-    std::copy_n(buffer_info.pDst[2] + i * stride1, width1,
-                yuv_image->yuv[2] + i * width1);
-  }
+  libyuv::CopyPlane(buffer_info.pDst[1], static_cast<int>(stride1),
+                    yuv_image->yuv[1], static_cast<int>(width1),
+                    static_cast<int>(width1), static_cast<int>(height1));
+  libyuv::CopyPlane(buffer_info.pDst[2], static_cast<int>(stride1),
+                    yuv_image->yuv[2], static_cast<int>(width1),
+                    static_cast<int>(width1), static_cast<int>(height1));
 }
 
 }  // namespace hisui::video
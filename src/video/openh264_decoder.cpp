@@ -110,6 +110,10 @@ void OpenH264Decoder::updateImageByTimestamp(const std::uint64_t timestamp) {
                                     .height = m_next_yuv_image->getHeight(0)});
       }
     }
+    if (m_current_yuv_image != m_next_yuv_image) {
+      // 使わなくなる m_current_yuv_image は次のデコード結果の格納先として使い回す
+      m_spare_yuv_image = m_current_yuv_image;
+    }
     m_current_yuv_image = m_next_yuv_image;
     m_current_timestamp = m_next_timestamp;
     if (m_webm->readFrame()) {
@@ -125,7 +129,11 @@ void OpenH264Decoder::updateImageByTimestamp(const std::uint64_t timestamp) {
       }
       m_next_timestamp = static_cast<std::uint64_t>(m_webm->getTimestamp());
       if (buffer_info.iBufferStatus == 1) {
-        m_next_yuv_image = std::make_shared<YUVImage>(m_width, m_height);
+        if (!m_spare_yuv_image) {
+          m_spare_yuv_image = std::make_shared<YUVImage>(m_width, m_height);
+        }
+        m_next_yuv_image = m_spare_yuv_image;
+        m_spare_yuv_image = nullptr;
         update_yuv_image_by_openh264_buffer_info(m_next_yuv_image.get(),
                                                  buffer_info);
       }
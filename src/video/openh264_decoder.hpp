@@ -30,6 +30,7 @@ class OpenH264Decoder : public Decoder {
   std::uint64_t m_next_timestamp = 0;
   std::shared_ptr<YUVImage> m_current_yuv_image = nullptr;
   std::shared_ptr<YUVImage> m_next_yuv_image = nullptr;
+  std::shared_ptr<YUVImage> m_spare_yuv_image = nullptr;
   std::uint8_t* m_tmp_yuv[3];
   bool m_report_enabled = false;
 
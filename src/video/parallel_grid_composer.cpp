@@ -48,9 +48,6 @@ ParallelGridComposer::ParallelGridComposer(
   m_plane_sizes[0] = m_width * m_height;
   m_plane_sizes[1] = (m_plane_sizes[0] + 3) >> 2;
   m_plane_sizes[2] = m_plane_sizes[1];
-  m_planes[0] = new unsigned char[m_plane_sizes[0]];
-  m_planes[1] = new unsigned char[m_plane_sizes[1]];
-  m_planes[2] = new unsigned char[m_plane_sizes[2]];
 
   m_single_plane_widths[0] = m_single_width;
   m_single_plane_widths[1] = (m_single_width + 1) >> 1;
@@ -63,54 +60,41 @@ ParallelGridComposer::ParallelGridComposer(
   m_plane_default_values[2] = 128;
 }
 
-ParallelGridComposer::~ParallelGridComposer() {
-  for (std::size_t p = 0; p < 3; ++p) {
-    delete[] m_planes[p];
-  }
-}
-
 void ParallelGridComposer::compose(std::vector<unsigned char>* composed,
                                    const std::vector<const YUVImage*>& images) {
   for (std::size_t i = 0; i < m_size; ++i) {
     m_scaled_images[i] = m_scalers[i]->scale(images[i]);
   }
 
+  // 各 plane は composed の重ならない領域なので, 中間バッファを経由せずに直接書き込む
   auto future0 = std::async(std::launch::async, [this, composed] {
     for (std::size_t i = 0; i < m_size; ++i) {
       m_srcs[0][i] = m_scaled_images[i]->yuv[0];
     }
-    merge_yuv_planes_from_top_left(m_planes[0], m_plane_sizes[0], m_column,
+    merge_yuv_planes_from_top_left(composed->data(), m_plane_sizes[0], m_column,
                                    m_srcs[0], m_size, m_single_plane_widths[0],
                                    m_single_plane_heights[0],
                                    m_plane_default_values[0]);
-
-    std::copy_n(m_planes[0], m_plane_sizes[0], composed->data());
   });
 
   auto future1 = std::async(std::launch::async, [this, composed] {
     for (std::size_t i = 0; i < m_size; ++i) {
       m_srcs[1][i] = m_scaled_images[i]->yuv[1];
     }
-    merge_yuv_planes_from_top_left(m_planes[1], m_plane_sizes[1], m_column,
-                                   m_srcs[1], m_size, m_single_plane_widths[1],
-                                   m_single_plane_heights[1],
-                                   m_plane_default_values[1]);
-
-    std::copy_n(m_planes[1], m_plane_sizes[1],
-                composed->data() + m_plane_sizes[0]);
+    merge_yuv_planes_from_top_left(
+        composed->data() + m_plane_sizes[0], m_plane_sizes[1], m_column,
+        m_srcs[1], m_size, m_single_plane_widths[1], m_single_plane_heights[1],
+        m_plane_default_values[1]);
   });
 
   auto future2 = std::async(std::launch::async, [this, composed] {
     for (std::size_t i = 0; i < m_size; ++i) {
       m_srcs[2][i] = m_scaled_images[i]->yuv[2];
     }
-    merge_yuv_planes_from_top_left(m_planes[2], m_plane_sizes[2], m_column,
-                                   m_srcs[2], m_size, m_single_plane_widths[2],
-                                   m_single_plane_heights[2],
-                                   m_plane_default_values[2]);
-
-    std::copy_n(m_planes[2], m_plane_sizes[2],
-                composed->data() + m_plane_sizes[0] + m_plane_sizes[1]);
+    merge_yuv_planes_from_top_left(
+        composed->data() + m_plane_sizes[0] + m_plane_sizes[1],
+        m_plane_sizes[2], m_column, m_srcs[2], m_size, m_single_plane_widths[2],
+        m_single_plane_heights[2], m_plane_default_values[2]);
   });
 
   future0.get();
@@ -2,10 +2,10 @@
 
 #include <bits/exception.h>
 #include <spdlog/fmt/bundled/format.h>
-#include <spdlog/spdlog.h>
 
 #include <algorithm>
 #include <array>
+#include <cstddef>
 #include <cstdint>
 #include <stdexcept>
 
@@ -21,13 +21,7 @@ PreserveAspectRatioScaler::PreserveAspectRatioScaler(
     const std::uint32_t t_width,
     const std::uint32_t t_height,
     const libyuv::FilterMode t_filter_mode)
-    : Scaler(t_width, t_height), m_filter_mode(t_filter_mode) {
-  m_intermediate = new YUVImage(m_width, m_height);
-}
-
-PreserveAspectRatioScaler::~PreserveAspectRatioScaler() {
-  delete m_intermediate;
-}
+    : Scaler(t_width, t_height), m_filter_mode(t_filter_mode) {}
 
 const YUVImage* PreserveAspectRatioScaler::scale(const YUVImage* src) {
   const auto src_width = src->getWidth(0);
@@ -61,42 +55,41 @@ const YUVImage* PreserveAspectRatioScaler::marginInHeightScale(
     return simpleScale(src);
   }
 
-  spdlog::trace("marginInHeightScale: {}x{}", m_width, intermediate_height);
-
-  m_intermediate->setWidthAndHeight(m_width, intermediate_height);
+  // 中間バッファを経由せずに m_scaled の余白を除いた領域へ直接縮小する
+  std::array<unsigned char*, 3> dst;
+  for (std::size_t p = 0; p < 3; ++p) {
+    const auto offset = ((m_height - intermediate_height) >> (p == 0 ? 1 : 2)) *
+                        m_scaled->getWidth(static_cast<int>(p));
+    dst[p] = m_scaled->yuv[p] + offset;
+  }
 
   const int ret = libyuv::I420Scale(
       src->yuv[0], static_cast<int>(src->getWidth(0)), src->yuv[1],
       static_cast<int>(src->getWidth(1)), src->yuv[2],
       static_cast<int>(src->getWidth(2)), static_cast<int>(src->getWidth(0)),
-      static_cast<int>(src->getHeight(0)), m_intermediate->yuv[0],
-      static_cast<int>(m_intermediate->getWidth(0)), m_intermediate->yuv[1],
-      static_cast<int>(m_intermediate->getWidth(1)), m_intermediate->yuv[2],
-      static_cast<int>(m_intermediate->getWidth(2)),
-      static_cast<int>(m_intermediate->getWidth(0)),
-      static_cast<int>(m_intermediate->getHeight(0)), m_filter_mode);
+      static_cast<int>(src->getHeight(0)), dst[0],
+      static_cast<int>(m_scaled->getWidth(0)), dst[1],
+      static_cast<int>(m_scaled->getWidth(1)), dst[2],
+      static_cast<int>(m_scaled->getWidth(2)), static_cast<int>(m_width),
+      static_cast<int>(intermediate_height), m_filter_mode);
 
   if (ret != 0) {
     throw std::runtime_error(
         fmt::format("I420Scale() failed: error_code={}", ret));
   }
 
-  m_scaled->setBlack();
-
-  std::copy_n(m_intermediate->yuv[0],
-              m_intermediate->getWidth(0) * m_intermediate->getHeight(0),
-              m_scaled->yuv[0] + ((m_height - intermediate_height) >> 1) *
-                                     m_intermediate->getWidth(0));
-
-  std::copy_n(m_intermediate->yuv[1],
-              m_intermediate->getWidth(1) * m_intermediate->getHeight(1),
-              m_scaled->yuv[1] + ((m_height - intermediate_height) >> 2) *
-                                     m_intermediate->getWidth(1));
-
-  std::copy_n(m_intermediate->yuv[2],
-              m_intermediate->getWidth(2) * m_intermediate->getHeight(2),
-              m_scaled->yuv[2] + ((m_height - intermediate_height) >> 2) *
-                                     m_intermediate->getWidth(2));
+  // setBlack() してから上書きすると画像全体に 2 回書き込むことになるので, 余白部分のみを塗る
+  for (std::size_t p = 0; p < 3; ++p) {
+    const int plane = static_cast<int>(p);
+    const unsigned char default_value = p == 0 ? 0 : 128;
+    const auto plane_end = m_scaled->yuv[p] + m_scaled->getWidth(plane) *
+                                                  m_scaled->getHeight(plane);
+    const auto scaled_size =
+        m_scaled->getWidth(plane) *
+        (p == 0 ? intermediate_height : intermediate_height >> 1);
+    std::fill(m_scaled->yuv[p], dst[p], default_value);
+    std::fill(dst[p] + scaled_size, plane_end, default_value);
+  }
   return m_scaled;
 }
 
@@ -111,48 +104,45 @@ const YUVImage* PreserveAspectRatioScaler::marginInWidthScale(
     return simpleScale(src);
   }
 
-  spdlog::trace("marginInWidthScale: {}x{}", intermediate_width, m_height);
-
-  m_intermediate->setWidthAndHeight(intermediate_width, m_height);
+  // 中間バッファを経由せずに m_scaled の余白を除いた領域へ直接縮小する
+  std::array<unsigned char*, 3> dst;
+  for (std::size_t p = 0; p < 3; ++p) {
+    const auto width_in_plane =
+        p == 0 ? intermediate_width : intermediate_width >> 1;
+    const auto left =
+        (m_scaled->getWidth(static_cast<int>(p)) - width_in_plane) >> 1;
+    dst[p] = m_scaled->yuv[p] + left;
+  }
 
   const int ret = libyuv::I420Scale(
       src->yuv[0], static_cast<int>(src->getWidth(0)), src->yuv[1],
       static_cast<int>(src->getWidth(1)), src->yuv[2],
       static_cast<int>(src->getWidth(2)), static_cast<int>(src->getWidth(0)),
-      static_cast<int>(src->getHeight(0)), m_intermediate->yuv[0],
-      static_cast<int>(m_intermediate->getWidth(0)), m_intermediate->yuv[1],
-      static_cast<int>(m_intermediate->getWidth(1)), m_intermediate->yuv[2],
-      static_cast<int>(m_intermediate->getWidth(2)),
-      static_cast<int>(m_intermediate->getWidth(0)),
-      static_cast<int>(m_intermediate->getHeight(0)), m_filter_mode);
+      static_cast<int>(src->getHeight(0)), dst[0],
+      static_cast<int>(m_scaled->getWidth(0)), dst[1],
+      static_cast<int>(m_scaled->getWidth(1)), dst[2],
+      static_cast<int>(m_scaled->getWidth(2)),
+      static_cast<int>(intermediate_width), static_cast<int>(m_height),
+      m_filter_mode);
 
   if (ret != 0) {
     throw std::runtime_error(
         fmt::format("I420Scale() failed: error_code={}", ret));
   }
 
-  m_scaled->setBlack();
-
-  for (std::uint32_t h = 0, m = m_intermediate->getHeight(0); h < m; ++h) {
-    std::copy_n(
-        m_intermediate->yuv[0] + h * intermediate_width, intermediate_width,
-        m_scaled->yuv[0] + m_width * h + ((m_width - intermediate_width) >> 1));
-  }
-
-  const auto m_width2 = m_scaled->getWidth(1);
-  const auto intermediate_width2 = intermediate_width >> 1;
-  for (std::uint32_t h = 0, m = m_intermediate->getHeight(1); h < m; ++h) {
-    std::copy_n(m_intermediate->yuv[1] + h * intermediate_width2,
-                intermediate_width2,
-                m_scaled->yuv[1] + m_width2 * h +
-                    ((m_width2 - intermediate_width2) >> 1));
-  }
-
-  for (std::uint32_t h = 0, m = m_intermediate->getHeight(2); h < m; ++h) {
-    std::copy_n(m_intermediate->yuv[2] + h * intermediate_width2,
-                intermediate_width2,
-                m_scaled->yuv[2] + m_width2 * h +
-                    ((m_width2 - intermediate_width2) >> 1));
+  // setBlack() してから上書きすると画像全体に 2 回書き込むことになるので, 余白部分のみを塗る
+  for (std::size_t p = 0; p < 3; ++p) {
+    const int plane = static_cast<int>(p);
+    const unsigned char default_value = p == 0 ? 0 : 128;
+    const auto width = m_scaled->getWidth(plane);
+    const auto width_in_plane =
+        p == 0 ? intermediate_width : intermediate_width >> 1;
+    const auto left = (width - width_in_plane) >> 1;
+    for (std::uint32_t h = 0, m = m_scaled->getHeight(plane); h < m; ++h) {
+      auto row = m_scaled->yuv[p] + width * h;
+      std::fill_n(row, left, default_value);
+      std::fill(row + left + width_in_plane, row + width, default_value);
+    }
   }
 
   return m_scaled;
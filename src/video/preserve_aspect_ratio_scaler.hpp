@@ -22,12 +22,10 @@ class PreserveAspectRatioScaler : public Scaler {
   PreserveAspectRatioScaler(const std::uint32_t,
                             const std::uint32_t,
                             const libyuv::FilterMode);
-  ~PreserveAspectRatioScaler();
   const YUVImage* scale(const YUVImage*);
 
  private:
   const libyuv::FilterMode m_filter_mode;
-  YUVImage* m_intermediate;
 
   const YUVImage* simpleScale(const YUVImage*);
   const YUVImage* marginInHeightScale(const YUVImage*,
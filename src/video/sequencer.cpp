@@ -18,6 +18,12 @@
 #include "video/source.hpp"
 #include "video/webm_source.hpp"
 
+namespace {
+
+const std::set<std::string> image_extensions({".png", ".jpg", ".jpeg"});
+
+}  // namespace
+
 namespace hisui::video {
 
 std::uint32_t Sequencer::getMaxWidth() const {
@@ -38,8 +44,6 @@ MakeSequenceResult make_sequence(const std::vector<hisui::Archive>& archives) {
   auto& max_width = result.max_width;
   auto& max_height = result.max_height;
 
-  const std::set<std::string> image_extensions({".png", ".jpg", ".jpeg"});
-
   for (const auto& archive : archives) {
     Source* source;
     const auto& path = archive.getPath();
@@ -60,10 +64,10 @@ MakeSequenceResult make_sequence(const std::vector<hisui::Archive>& archives) {
     if (height > max_height) {
       max_height = height;
     }
-    const auto connection_id = archive.getConnectionID();
+    const auto& connection_id = archive.getConnectionID();
     const auto it = std::find_if(
         std::begin(sequence), std::end(sequence),
-        [connection_id](
+        [&connection_id](
             const std::pair<std::string,
                             std::shared_ptr<std::vector<SourceAndInterval>>>&
                 elem) { return elem.first == connection_id; });
@@ -2,6 +2,7 @@
 
 #include <bits/exception.h>
 #include <fmt/core.h>
+#include <libyuv/planar_functions.h>
 #include <spdlog/fmt/bundled/format.h>
 #include <spdlog/spdlog.h>
 #include <vpx/vp8cx.h>
@@ -14,7 +15,6 @@
 #include <algorithm>
 #include <array>
 #include <cstddef>
-#include <iterator>
 #include <stdexcept>
 #include <vector>
 
@@ -24,6 +24,12 @@
 #include "constants.hpp"
 #include "video/yuv.hpp"
 
+namespace {
+
+constexpr std::array PLANES_YUV{VPX_PLANE_Y, VPX_PLANE_U, VPX_PLANE_V};
+
+}  // namespace
+
 namespace hisui::video {
 
 VPXEncoderConfig::VPXEncoderConfig(const std::uint32_t t_width,
@@ -45,8 +51,6 @@ VPXEncoderConfig::VPXEncoderConfig(const std::uint32_t t_width,
 
 void update_yuv_image_by_vpx_image(YUVImage* yuv_image,
                                    const vpx_image_t* vpx_image) {
-  const std::array<int, 3> PLANES_YUV = {VPX_PLANE_Y, VPX_PLANE_U, VPX_PLANE_V};
-
   const std::uint32_t new_width =
       get_vpx_image_plane_width(vpx_image, VPX_PLANE_Y);
   const std::uint32_t new_height =
@@ -61,10 +65,10 @@ void update_yuv_image_by_vpx_image(YUVImage* yuv_image,
     const std::uint32_t s =
         static_cast<std::uint32_t>(vpx_image->stride[plane]);
 
-    for (std::uint32_t y = 0; y < h; ++y) {
-      std::copy_n(vpx_image->planes[plane] + y * s, w,
-                  yuv_image->yuv[i] + y * w);
-    }
+    // stride と幅が一致する場合は libyuv::CopyPlane() がまとめて 1 回でコピーする
+    libyuv::CopyPlane(vpx_image->planes[plane], static_cast<int>(s),
+                      yuv_image->yuv[i], static_cast<int>(w),
+                      static_cast<int>(w), static_cast<int>(h));
   }
 }
 
@@ -108,7 +112,6 @@ std::uint32_t get_vpx_image_plane_height(const ::vpx_image_t* img,
 
 ::vpx_image_t* create_black_vpx_image(const std::uint32_t width,
                                       const std::uint32_t height) {
-  const std::array<int, 3> PLANES_YUV = {VPX_PLANE_Y, VPX_PLANE_U, VPX_PLANE_V};
   const auto img = ::vpx_img_alloc(nullptr, VPX_IMG_FMT_I420, width, height, 0);
   std::fill(img->planes[PLANES_YUV[0]],
             img->planes[PLANES_YUV[0]] + width * height, 0);
@@ -131,9 +134,9 @@ void update_vpx_image_by_yuv_data(::vpx_image_t* img,
                             ((img->fmt & VPX_IMG_FMT_HIGHBITDEPTH) ? 2 : 1);
     const std::uint32_t h = get_vpx_image_plane_height(img, plane);
 
-    for (std::uint32_t y = 0; y < h; ++y) {
-      std::copy_n(std::begin(v) + base + y * w, w, buf + y * stride);
-    }
+    libyuv::CopyPlane(v.data() + base, static_cast<int>(w), buf,
+                      static_cast<int>(stride), static_cast<int>(w),
+                      static_cast<int>(h));
     base += h * w;
   }
 }
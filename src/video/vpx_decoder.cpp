@@ -68,9 +68,12 @@ const YUVImage* VPXDecoder::getImage(const std::uint64_t timestamp) {
     m_is_time_over = true;
     return m_black_yuv_image;
   }
-  // 極端におおきな fps にはしないと思うので m_current_yuv_image への変換は毎回やってよいと考えている
   updateVPXImage(timestamp);
-  update_yuv_image_by_vpx_image(m_current_yuv_image, m_current_vpx_image);
+  // 出力の fps が入力より高い場合は同じ画像が続くので, m_current_vpx_image が更新されたときだけ変換する
+  if (m_is_current_vpx_image_updated) {
+    update_yuv_image_by_vpx_image(m_current_yuv_image, m_current_vpx_image);
+    m_is_current_vpx_image_updated = false;
+  }
   return m_current_yuv_image;
 }
 
@@ -107,8 +110,8 @@ void VPXDecoder::updateVPXImageByTimestamp(const std::uint64_t timestamp) {
     }
     m_current_vpx_image = m_next_vpx_image;
     m_current_timestamp = m_next_timestamp;
+    m_is_current_vpx_image_updated = true;
     if (m_webm->readFrame()) {
-      spdlog::trace("webm->getBufferSize(): {}", m_webm->getBufferSize());
       const auto ret = ::vpx_codec_decode(
           &m_codec, m_webm->getBuffer(),
           static_cast<unsigned int>(m_webm->getBufferSize()), nullptr, 0);
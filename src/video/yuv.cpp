@@ -81,8 +81,6 @@ void merge_yuv_planes_from_top_left(
     const std::uint32_t src_width,
     const std::uint32_t src_height,
     const unsigned char default_value) {
-  std::fill_n(merged, merged_size, default_value);
-
   for (std::size_t i = 0; i < number_of_srcs; ++i) {
     const auto c = i % column;
     const auto r = i / column;
@@ -92,6 +90,23 @@ void merge_yuv_planes_from_top_left(
                       y * column * src_width);
     }
   }
+
+  // 全体を default_value で塗ってから上書きすると 2 回書き込むことになるので, src が置かれなかった部分のみを塗る
+  const std::size_t line_size = column * src_width;
+  const std::size_t grid_row_size = line_size * src_height;
+  const auto number_of_full_rows = number_of_srcs / column;
+  const auto rest = number_of_srcs % column;
+  std::size_t filled_size = number_of_full_rows * grid_row_size;
+  if (rest > 0) {
+    for (std::uint32_t y = 0; y < src_height; ++y) {
+      std::fill_n(merged + filled_size + y * line_size + rest * src_width,
+                  (column - rest) * src_width, default_value);
+    }
+    filled_size += grid_row_size;
+  }
+  if (filled_size < merged_size) {
+    std::fill_n(merged + filled_size, merged_size - filled_size, default_value);
+  }
 }
 
 }  // namespace hisui::video
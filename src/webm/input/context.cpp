@@ -4,8 +4,12 @@
 #include <mkvparser/mkvparser.h>
 #include <mkvparser/mkvreader.h>
 
+#include <cstdio>
+#include <iterator>
 #include <stdexcept>
 
+#include "constants.hpp"
+
 namespace hisui::webm::input {
 
 void Context::reset() {
@@ -22,6 +26,7 @@ void Context::reset() {
   m_segment = nullptr;
   m_buffer = nullptr;
   m_buffer_size = 0;
+  m_buffer_capacity = 0;
   m_cluster = nullptr;
   m_block_entry = nullptr;
   m_block = nullptr;
@@ -37,6 +42,9 @@ void Context::reset() {
 }
 
 void Context::initReaderAndSegment(std::FILE* file) {
+  // MkvReader は小さな単位で fseek/fread を繰り返すので, デフォルトより大きなバッファを使って read(2) の回数を減らす
+  m_file_buffer.resize(hisui::Constants::WEBM_INPUT_FILE_BUFFER_SIZE);
+  std::setvbuf(file, m_file_buffer.data(), _IOFBF, std::size(m_file_buffer));
   m_reader = new mkvparser::MkvReader(file);
   m_reached_eos = false;
 
@@ -138,11 +146,13 @@ bool Context::readFrame() {
   const mkvparser::Block::Frame& frame = m_block->GetFrame(m_block_frame_index);
   ++m_block_frame_index;
   std::size_t frame_len = static_cast<std::size_t>(frame.len);
-  if (frame_len > m_buffer_size) {
+  // 直前のフレームではなく確保済みのサイズと比較して, フレームサイズが上下するたびに確保し直さないようにする
+  if (frame_len > m_buffer_capacity) {
     if (m_buffer != nullptr) {
       delete[] m_buffer;
     }
     m_buffer = new unsigned char[frame_len];
+    m_buffer_capacity = frame_len;
   }
   m_buffer_size = frame_len;
   m_timestamp_ns = m_block->GetTime(m_cluster);
@@ -172,7 +182,7 @@ std::int64_t Context::getDuration() const {
   return m_segment->GetDuration();
 }
 
-std::string Context::getFilePath() const {
+const std::string& Context::getFilePath() const {
   return m_file_path;
 }
 
@@ -4,6 +4,7 @@
 #include <cstdint>
 #include <cstdio>
 #include <string>
+#include <vector>
 
 namespace mkvparser {
 
@@ -25,7 +26,7 @@ class Context {
   virtual bool init() = 0;
   std::size_t getBufferSize() const;
   unsigned char* getBuffer();
-  std::string getFilePath() const;
+  const std::string& getFilePath() const;
   std::int64_t getTimestamp() const;
   std::int64_t getDuration() const;
   bool readFrame();
@@ -50,6 +51,8 @@ class Context {
   int m_block_frame_index = 0;
   bool m_reached_eos = false;
   std::size_t m_buffer_size = 0;
+  std::size_t m_buffer_capacity = 0;
+  std::vector<char> m_file_buffer;
   std::int64_t m_timestamp_ns = 0;
   bool m_is_key_frame = false;
 };
@@ -1,5 +1,7 @@
 #include "webm/output/context.hpp"
 
+#include <cstdio>
+#include <iterator>
 #include <stdexcept>
 #include <string>
 
@@ -19,6 +21,10 @@ void Context::init() {
     throw std::runtime_error("Unable to open: " + m_file_path);
   }
 
+  // 小さな書き込みが多いので, 大きめのバッファを設定して write(2) の回数を減らす
+  m_file_buffer.resize(hisui::Constants::OUTPUT_FILE_BUFFER_SIZE);
+  std::setvbuf(m_file, m_file_buffer.data(), _IOFBF, std::size(m_file_buffer));
+
   m_writer = new mkvmuxer::MkvWriter(m_file);
   m_segment = new mkvmuxer::Segment();
   m_segment->Init(m_writer);
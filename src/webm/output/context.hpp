@@ -4,6 +4,7 @@
 #include <cstdint>
 #include <cstdio>
 #include <string>
+#include <vector>
 
 namespace mkvmuxer {
 
@@ -38,6 +39,7 @@ class Context {
  private:
   std::string m_file_path;
   std::FILE* m_file = nullptr;
+  std::vector<char> m_file_buffer;
   mkvmuxer::MkvWriter* m_writer;
   mkvmuxer::Segment* m_segment;
   const std::uint64_t m_video_track_number = 1;
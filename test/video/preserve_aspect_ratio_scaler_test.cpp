@@ -0,0 +1,112 @@
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+#include <boost/test/unit_test.hpp>
+
+#include "libyuv/scale.h"
+
+#include "video/preserve_aspect_ratio_scaler.hpp"
+#include "video/yuv.hpp"
+
+namespace {
+
+hisui::video::YUVImage* create_filled_yuv_image(const std::uint32_t width,
+                                                const std::uint32_t height) {
+  auto image = new hisui::video::YUVImage(width, height);
+  const unsigned char values[] = {200, 50, 60};
+  for (std::size_t p = 0; p < 3; ++p) {
+    const int plane = static_cast<int>(p);
+    std::fill_n(image->yuv[p], image->getWidth(plane) * image->getHeight(plane),
+                values[p]);
+  }
+  return image;
+}
+
+// 指定した矩形の内側が value, 外側が余白の値になっていることを確認する
+void require_plane(const hisui::video::YUVImage* image,
+                   const std::size_t p,
+                   const std::uint32_t left,
+                   const std::uint32_t top,
+                   const std::uint32_t width,
+                   const std::uint32_t height,
+                   const unsigned char value) {
+  const int plane = static_cast<int>(p);
+  const unsigned char margin = p == 0 ? 0 : 128;
+  const auto plane_width = image->getWidth(plane);
+  const auto plane_height = image->getHeight(plane);
+  std::vector<unsigned char> expected(plane_width * plane_height, margin);
+  for (std::uint32_t h = top; h < top + height; ++h) {
+    std::fill_n(expected.data() + plane_width * h + left, width, value);
+  }
+  BOOST_REQUIRE_EQUAL_COLLECTIONS(expected.begin(), expected.end(),
+                                  image->yuv[p],
+                                  image->yuv[p] + expected.size());
+}
+
+}  // namespace
+
+BOOST_AUTO_TEST_SUITE(preserve_aspect_ratio_scaler)
+
+BOOST_AUTO_TEST_CASE(margin_in_height) {
+  auto src = create_filled_yuv_image(8, 4);
+  hisui::video::PreserveAspectRatioScaler scaler(8, 8, libyuv::kFilterNone);
+
+  auto scaled = scaler.scale(src);
+
+  BOOST_REQUIRE_EQUAL(scaled->getWidth(0), 8);
+  BOOST_REQUIRE_EQUAL(scaled->getHeight(0), 8);
+  require_plane(scaled, 0, 0, 2, 8, 4, 200);
+  require_plane(scaled, 1, 0, 1, 4, 2, 50);
+  require_plane(scaled, 2, 0, 1, 4, 2, 60);
+
+  delete src;
+}
+
+BOOST_AUTO_TEST_CASE(margin_in_height_odd) {
+  auto src = create_filled_yuv_image(8, 4);
+  hisui::video::PreserveAspectRatioScaler scaler(7, 9, libyuv::kFilterNone);
+
+  auto scaled = scaler.scale(src);
+
+  BOOST_REQUIRE_EQUAL(scaled->getWidth(0), 7);
+  BOOST_REQUIRE_EQUAL(scaled->getHeight(0), 9);
+  require_plane(scaled, 0, 0, 2, 7, 4, 200);
+  require_plane(scaled, 1, 0, 1, 4, 2, 50);
+  require_plane(scaled, 2, 0, 1, 4, 2, 60);
+
+  delete src;
+}
+
+BOOST_AUTO_TEST_CASE(margin_in_width) {
+  auto src = create_filled_yuv_image(4, 8);
+  hisui::video::PreserveAspectRatioScaler scaler(8, 8, libyuv::kFilterNone);
+
+  auto scaled = scaler.scale(src);
+
+  BOOST_REQUIRE_EQUAL(scaled->getWidth(0), 8);
+  BOOST_REQUIRE_EQUAL(scaled->getHeight(0), 8);
+  require_plane(scaled, 0, 2, 0, 4, 8, 200);
+  require_plane(scaled, 1, 1, 0, 2, 4, 50);
+  require_plane(scaled, 2, 1, 0, 2, 4, 60);
+
+  delete src;
+}
+
+BOOST_AUTO_TEST_CASE(margin_in_width_odd) {
+  auto src = create_filled_yuv_image(4, 8);
+  hisui::video::PreserveAspectRatioScaler scaler(9, 7, libyuv::kFilterNone);
+
+  auto scaled = scaler.scale(src);
+
+  BOOST_REQUIRE_EQUAL(scaled->getWidth(0), 9);
+  BOOST_REQUIRE_EQUAL(scaled->getHeight(0), 7);
+  require_plane(scaled, 0, 2, 0, 4, 7, 200);
+  require_plane(scaled, 1, 1, 0, 2, 4, 50);
+  require_plane(scaled, 2, 1, 0, 2, 4, 60);
+
+  delete src;
+}
+
+BOOST_AUTO_TEST_SUITE_END()
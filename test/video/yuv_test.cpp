@@ -1,3 +1,5 @@
+#include <algorithm>
+
 #include <boost/test/unit_test.hpp>
 
 #include "video/yuv.hpp"
@@ -93,6 +95,25 @@ BOOST_AUTO_TEST_CASE(merge_yuv_planes_from_top_left_2x2c) {
   delete[] merged;
 }
 
+BOOST_AUTO_TEST_CASE(merge_yuv_planes_from_top_left_2x3) {
+  unsigned char p1[4] = {1, 1, 1, 1};
+  unsigned char p2[4] = {2, 2, 2, 2};
+  unsigned char p3[4] = {3, 3, 3, 3};
+  unsigned char p4[4] = {4, 4, 4, 4};
+  std::vector<const unsigned char*> yuvs{p1, p2, p3, p4};
+
+  unsigned char* merged = new unsigned char[28];
+  std::fill_n(merged, 28, 255);
+  hisui::video::merge_yuv_planes_from_top_left(merged, 28, 3, yuvs, 4, 2, 2,
+                                               128);
+  unsigned char expected[28] = {1,   1,   2,   2,   3,   3,   1,   1,   2, 2,
+                                3,   3,   4,   4,   128, 128, 128, 128, 4, 4,
+                                128, 128, 128, 128, 128, 128, 128, 128};
+
+  BOOST_REQUIRE_EQUAL_COLLECTIONS(expected, expected + 28, merged, merged + 28);
+  delete[] merged;
+}
+
 BOOST_AUTO_TEST_CASE(create_black_yuv_image_1) {
   hisui::video::YUVImage* yuv = hisui::video::create_black_yuv_image(4, 2);
 
@@ -3,6 +3,8 @@
 #include <chrono>
 #include <cstdint>
 #include <iostream>
+#include <sstream>
+#include <string>
 
 namespace progresscpp {
 class ProgressBar {
@@ -32,15 +34,17 @@ public:
         std::chrono::steady_clock::time_point now = std::chrono::steady_clock::now();
         auto time_elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - start_time).count();
 
-        std::cout << "[";
-
+        std::string bar(bar_width, incomplete_char);
         for (std::uint64_t i = 0; i < bar_width; ++i) {
-            if (i < pos) std::cout << complete_char;
-            else if (i == pos) std::cout << ">";
-            else std::cout << incomplete_char;
+            if (i < pos) bar[i] = complete_char;
+            else if (i == pos) bar[i] = '>';
         }
-        std::cout << "] " << int(progress * 100.0f) << "% "
-                  << float(time_elapsed) / 1000.0f << "s\r";
+
+        // 1 行分を組み立ててから 1 回で書き出す
+        std::ostringstream line;
+        line << "[" << bar << "] " << int(progress * 100.0f) << "% "
+             << float(time_elapsed) / 1000.0f << "s\r";
+        std::cout << line.str();
         std::cout.flush();
     }
 